@@ -412,10 +412,10 @@ CREATE INDEX idx_address_blocks_memory_map ON addressBlocks(memoryMap_id);
 CREATE INDEX idx_address_blocks_base_address ON addressBlocks(baseAddress);
 CREATE INDEX idx_address_blocks_range ON addressBlocks(range);
 
-CREATE INDEX idx_registers_address_block ON registers(addressBlock_id);
+CREATE INDEX idx_registers_address_block ON registers(addressBlock_id, regFileRef, addressOffset);
 CREATE INDEX idx_registers_address_offset ON registers(addressOffset);
 
-CREATE INDEX idx_fields_register ON fields(register_id);
+CREATE INDEX idx_fields_register ON fields(register_id, bitOffset);
 CREATE INDEX idx_fields_bit_offset ON fields(bitOffset);
 
 CREATE INDEX idx_bus_interfaces_metadata ON busInterfaces(metadata_id);
@@ -427,7 +427,7 @@ CREATE INDEX idx_ports_direction ON ports(direction);
 CREATE INDEX idx_parameters_metadata ON parameters(metadata_id);
 CREATE INDEX idx_parameters_type ON parameters(type);
 
-CREATE INDEX idx_vendor_extensions_metadata ON vendorExtensions(metadata_id);
+CREATE INDEX idx_vendor_extensions_metadata ON vendorExtensions(metadata_id, key);
 CREATE INDEX idx_vendor_extensions_vendor ON vendorExtensions(vendorId);
 
 CREATE INDEX idx_enumerations_field ON enumerations(field_id);
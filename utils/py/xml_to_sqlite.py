@@ -14,18 +14,275 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
+import io
 import os
+import re
+import shutil
 import sqlite3
-import xml.etree.ElementTree as ET
+import sys
+import tempfile
+import time
 import hashlib
-from datetime import datetime
 import logging
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
+
+# lxml is preferred for its C-level parsing and compiled XPath; the standard
+# library ElementTree is used when lxml is not installed.
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Namespaces of the supported schemas and the component element of each.
+# Only these are treated as components, so that e.g. a vendor extension
+# element that happens to be named "component" is not picked up.
+SPIRIT_NS = 'http://www.spiritconsortium.org/XMLSchema/SPIRIT/1685-2009'
+IPXACT_NS = 'http://www.accellera.org/XMLSchema/IPXACT/1685-2014'
+SPIRIT_COMPONENT = f'{{{SPIRIT_NS}}}component'
+IPXACT_COMPONENT = f'{{{IPXACT_NS}}}component'
+_COMPONENT_TAGS = (SPIRIT_COMPONENT, IPXACT_COMPONENT)
+
+# Function: split_qname
+#
+# Split a Clark-notation tag ('{namespace}local') into its namespace and
+# local name. Results are memoized in _QNAME_CACHE since a document only
+# uses a handful of distinct tags.
+#
+# Parameters:
+#
+#   tag (str) - Element tag
+#
+# Returns:
+#   Tuple[str, str] - (namespace, local name); namespace is '' if none
+_QNAME_CACHE: Dict[str, Tuple[str, str]] = {}
+
+def split_qname(tag: str) -> Tuple[str, str]:
+    result = _QNAME_CACHE.get(tag)
+    if result is None:
+        if tag[:1] == '{':
+            namespace, _, local = tag[1:].partition('}')
+            result = (namespace, local)
+        else:
+            result = ('', tag)
+        _QNAME_CACHE[tag] = result
+    return result
+
+# Function: _parse_int
+#
+# Convert an integer literal from the XML to int.
+# Decimal text is tried first (so '010' stays 10, as with int()), then any
+# prefixed literal such as '0x1A'. Results are memoized in _INT_CACHE since
+# widths, sizes and offsets repeat heavily across a document.
+#
+# Parameters:
+#
+#   text (str)    - Literal to convert
+#   default (Any) - Value returned when the text is not an integer
+#
+# Returns:
+#   int - Parsed value, or default
+_INT_CACHE: Dict[str, int] = {}
+_INT_CACHE_MAX = 4096
+
+def _parse_int(text: str, default: Any = None) -> Any:
+    result = _INT_CACHE.get(text)
+    if result is not None:
+        return result
+    try:
+        result = int(text)
+    except (TypeError, ValueError):
+        try:
+            result = int(text, 0)
+        except (TypeError, ValueError):
+            return default
+    if len(_INT_CACHE) < _INT_CACHE_MAX:
+        _INT_CACHE[text] = result
+    return result
+
+# Function: _parse_bool
+#
+# Convert an xs:boolean text from the XML to bool.
+# The common spellings are resolved through _BOOL_MAP; anything else falls
+# back to a case-insensitive comparison with 'true'.
+#
+# Parameters:
+#
+#   text (Optional[str]) - Text to convert
+#
+# Returns:
+#   Optional[bool] - Parsed value, or None if text is None
+_BOOL_MAP = {
+    'true': True, 'True': True, 'TRUE': True, '1': True,
+    'false': False, 'False': False, 'FALSE': False, '0': False,
+}
+
+def _parse_bool(text: Optional[str]) -> Optional[bool]:
+    if text is None:
+        return None
+    result = _BOOL_MAP.get(text)
+    if result is None:
+        result = text.lower() == 'true'
+    return result
+
+# Function: _element_xml
+#
+# Serialize an element to an XML string without its tail text.
+# The tail is the whitespace after the element's end tag and is not part of
+# the element; lxml skips it with with_tail=False, ElementTree has no such
+# option so the tail is detached for the duration of the call.
+#
+# Parameters:
+#
+#   elem (ET.Element) - Element to serialize
+#
+# Returns:
+#   str - XML text of the element
+def _element_xml(elem) -> str:
+    if HAVE_LXML:
+        # lxml declares every namespace in scope on the element, which also
+        # keeps prefixes used only in attribute values (e.g. xsi:type) bound
+        return ET.tostring(elem, encoding='unicode', with_tail=False)
+    tail = elem.tail
+    elem.tail = None
+    try:
+        return ET.tostring(elem, encoding='unicode')
+    finally:
+        elem.tail = tail
+
+# Values accepted by the access and interfaceMode CHECK constraints of
+# schema.sql (None stores NULL)
+_VALID_ACCESS = frozenset({'read-only', 'write-only', 'read-write', 'writeOnce', 'read-writeOnce', None})
+_VALID_IFMODE = frozenset({'master', 'slave', 'system', None})
+
+# INSERT statements, kept as constants so each call reuses the same
+# string and hits the connection's statement cache
+_SQL_INSERT_METADATA = '''
+    INSERT INTO metadata (
+        vendor, library, name, version, description, namespace,
+        schemaVersion, created, sourceFile, checksum
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_MEMORYMAPS = '''
+    INSERT INTO memoryMaps (
+        metadata_id, name, description
+    ) VALUES (?, ?, ?)
+'''
+
+_SQL_INSERT_ADDRESSBLOCKS = '''
+    INSERT INTO addressBlocks (
+        memoryMap_id, name, description, baseAddress,
+        range, width, usage
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_REGISTERS = '''
+    INSERT INTO registers (
+        addressBlock_id, name, description, addressOffset,
+        size, access, volatile, resetValue, resetMask, rand
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_FIELDS = '''
+    INSERT INTO fields (
+        register_id, name, description, displayName, bitOffset, bitWidth, access, resetValue, resetTypeRef, resetTrigger, resetPolarity, resetSynchronization, resetDomain, resetDependency, resetSequence, resetMask, isVolatile, isReserved, modifiedWriteValue, readAction, writeValueConstraint, testable, isPresent, dependence, typeIdentifier, enumValuesRef, longDescription, groupName, displayGroup, alternateGroups, usage, enumName, enumValue, enumDisplayName, rand, mirror, volatile
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_BUSINTERFACES = '''
+    INSERT INTO busInterfaces (
+        metadata_id, name, busType, abstractionType, interfaceMode,
+        displayName, isPresent, initiative
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_VENDOREXT = '''
+    INSERT INTO vendorExtensions (
+        metadata_id, vendorId, key, value
+    ) VALUES (?, ?, ?, ?)
+'''
+
+_SQL_INSERT_PORTS = '''
+    INSERT INTO ports (
+        metadata_id, name, description, direction, isAddress,
+        isData, width, displayName
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_PARAMETERS = '''
+    INSERT INTO parameters (
+        metadata_id, name, displayName, value, description,
+        type, scope
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_ENUMERATIONS = '''
+    INSERT INTO enumerations (
+        field_id, name, value, displayName, description, usage
+    ) VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+# XML declaration at the start of a file and the encoding it declares
+_XML_DECLARATION = re.compile(rb'\s*<\?xml\s[^>]*\?>')
+_XML_ENCODING = re.compile(rb'encoding\s*=\s*["\']([A-Za-z0-9._-]+)["\']')
+# Document type declaration, possibly after comments, with an optional
+# internal subset
+_XML_DOCTYPE = re.compile(rb'(?:\s|<!--.*?-->)*(<!DOCTYPE\s[^\[>]*(?:\[.*?\]\s*)?>)', re.DOTALL)
+
+# Drops every table created from schema.sql, children before parents
+_DROP_TABLES_SQL = '''
+    DROP TABLE IF EXISTS fields;
+    DROP TABLE IF EXISTS registers;
+    DROP TABLE IF EXISTS addressBlocks;
+    DROP TABLE IF EXISTS memoryMaps;
+    DROP TABLE IF EXISTS busInterfaces;
+    DROP TABLE IF EXISTS ports;
+    DROP TABLE IF EXISTS parameters;
+    DROP TABLE IF EXISTS vendorExtensions;
+    DROP TABLE IF EXISTS enumerations;
+    DROP TABLE IF EXISTS original_xml;
+    DROP TABLE IF EXISTS metadata;
+'''
+
+# Function: _load_schema
+#
+# Read schema.sql once per process.
+# The copy next to this script is preferred; schema.sql in the current
+# working directory is used as a fallback.
+#
+# Returns:
+#   Tuple[str, str] - (schema path, schema SQL)
+@functools.lru_cache(maxsize=None)
+def _load_schema() -> Tuple[str, str]:
+    schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schema.sql')
+    if not os.path.exists(schema_path):
+        schema_path = os.path.abspath('schema.sql')
+    with open(schema_path, 'r') as f:
+        return schema_path, f.read()
+
+# Tables copied by XMLToSQLite.merge_database, parents before children,
+# as (table, foreign key column, referenced table)
+_MERGE_TABLES = (
+    ('metadata', None, None),
+    ('memoryMaps', 'metadata_id', 'metadata'),
+    ('addressBlocks', 'memoryMap_id', 'memoryMaps'),
+    ('registers', 'addressBlock_id', 'addressBlocks'),
+    ('fields', 'register_id', 'registers'),
+    ('enumerations', 'field_id', 'fields'),
+    ('busInterfaces', 'metadata_id', 'metadata'),
+    ('ports', 'metadata_id', 'metadata'),
+    ('parameters', 'metadata_id', 'metadata'),
+    ('vendorExtensions', 'metadata_id', 'metadata'),
+)
+
 # Class: XMLToSQLite
 #
 #  - Converts IP-XACT XML files to SQLite database format.
@@ -55,20 +312,45 @@ class XMLToSQLite:
     def __init__(self, db_path: str, debug: bool = False):
         """Initialize the converter with database path."""
         self.db_path = db_path
+        self.debug = debug
         self.conn = None
         self.cursor = None
         if debug:
             logger.setLevel(logging.DEBUG)
         self.namespaces = {
-            'ipxact': 'http://www.accellera.org/XMLSchema/IPXACT/1685-2014',
-            'spirit': 'http://www.spiritconsortium.org/XMLSchema/SPIRIT/1685-2009',
+            'ipxact': IPXACT_NS,
+            'spirit': SPIRIT_NS,
             'kactus2': 'http://funbase.cs.tut.fi/'
         }
+        # Namespace map and per-tag search paths used by get_text
+        self._ns_dict = {'spirit': self.namespaces['spirit'], 'ipxact': self.namespaces['ipxact']}
+        self._path_cache: Dict[str, tuple] = {}
+        # Lookup precedence used by get_text: SPIRIT, then IP-XACT, then no namespace
+        self._text_ns_rank = {self.namespaces['spirit']: 0, self.namespaces['ipxact']: 1, '': 2}
+        # Descendant index of the component being processed, see _descendants
+        self._indexed_root = None
+        self._element_index: Dict[str, List[ET.Element]] = {}
+        # Parameter values of the component being processed, see _index_parameters
+        self._parameters_root = None
+        self._parameters_cache: Dict[str, str] = {}
+        self._param_int: Dict[str, int] = {}
+        # Port widths keyed by (left, right) vector bounds, reset per component
+        self._width_cache: Dict[Tuple[str, str], Optional[int]] = {}
+        # MD5 digests keyed by (path, mtime, size), see calculate_checksum
+        self._checksum_cache: Dict[tuple, str] = {}
 
     # Function: connect
     #
     # Establish connection to SQLite database.
     # Creates a new database file if it doesn't exist.
+    # The connection is tuned for bulk loading: in-memory rollback journal,
+    # relaxed synchronous mode, in-memory temp store and a 128MB page cache.
+    # The journal mode is not stored in the file (unlike WAL), so readers of
+    # the generated database need no write access to its directory; the
+    # database is created from scratch on every run, so an interrupted load
+    # loses nothing.
+    # The connection is opened in autocommit mode; transactions are started
+    # explicitly with <begin>.
     #
     # Raises:
     #   sqlite3.Error - If there are any database connection issues
@@ -81,13 +363,40 @@ class XMLToSQLite:
     def connect(self):
         """Connect to SQLite database."""
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = sqlite3.connect(self.db_path, cached_statements=256, isolation_level=None)
+            # Creation time shared by every component of this run (epoch seconds)
+            self._run_ts = int(time.time())
             self.cursor = self.conn.cursor()
+            self.cursor.execute("PRAGMA journal_mode=MEMORY")
+            self.cursor.execute("PRAGMA synchronous=NORMAL")
+            self.cursor.execute("PRAGMA temp_store=MEMORY")
+            self.cursor.execute("PRAGMA cache_size=-131072")
             logger.info(f"Connected to database: {self.db_path}")
         except sqlite3.Error as e:
             logger.error(f"Database connection error: {e}")
             raise
 
+    # Function: begin
+    #
+    # Start an explicit transaction.
+    # All inserts up to the matching <commit_all> call are written with a
+    # single journal sync instead of one per statement.
+    #
+    # Example:
+    #   converter.begin()
+    #   converter.process_xml_file("input.xml")
+    #   converter.commit_all()
+    def begin(self):
+        """Begin an explicit transaction."""
+        self.conn.execute("BEGIN")
+
+    # Function: commit_all
+    #
+    # Commit the transaction opened by <begin>.
+    def commit_all(self):
+        """Commit the current transaction."""
+        self.conn.commit()
+
     # Function: close
     #
     # Close the database connection.
@@ -104,7 +413,7 @@ class XMLToSQLite:
 
     # Function: create_tables
     #
-    # Create database tables from schema.sql.
+    # Create database tables from schema.sql (see <_load_schema>).
     # Drops existing tables if they exist to ensure a clean state.
     #
     # The schema includes tables for:
@@ -131,40 +440,172 @@ class XMLToSQLite:
     def create_tables(self):
         """Create database tables from schema.sql."""
         try:
-            import os
-            schema_path = os.path.abspath('schema.sql')
-            print(f"[DEBUG] Using schema file: {schema_path}")
-            with open(schema_path, 'r') as f:
-                schema_lines = f.readlines()
-                print("[DEBUG] First 10 lines of schema.sql:")
-                for line in schema_lines[:10]:
-                    print(line.rstrip())
-                schema = ''.join(schema_lines)
+            schema_path, schema = _load_schema()
+            logger.debug(f"Using schema file: {schema_path}")
             # Drop existing tables if they exist
-            self.cursor.executescript('''
-                DROP TABLE IF EXISTS fields;
-                DROP TABLE IF EXISTS registers;
-                DROP TABLE IF EXISTS addressBlocks;
-                DROP TABLE IF EXISTS memoryMaps;
-                DROP TABLE IF EXISTS busInterfaces;
-                DROP TABLE IF EXISTS ports;
-                DROP TABLE IF EXISTS parameters;
-                DROP TABLE IF EXISTS vendorExtensions;
-                DROP TABLE IF EXISTS enumerations;
-                DROP TABLE IF EXISTS original_xml;
-                DROP TABLE IF EXISTS metadata;
-            ''')
+            self.cursor.executescript(_DROP_TABLES_SQL)
             self.cursor.executescript(schema)
-            self.conn.commit()
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Error creating tables: {e}")
             raise
 
+    # Function: analyze
+    #
+    # Refresh the query planner statistics (sqlite_stat1).
+    # Called once after all XML files are loaded so that readers of the
+    # database pick the composite indexes from schema.sql for their
+    # WHERE/ORDER BY lookups.
+    #
+    # Example:
+    #   converter.analyze()
+    def analyze(self):
+        """Update query planner statistics."""
+        self.cursor.execute("ANALYZE")
+        self.conn.commit()
+        logger.debug("Database statistics updated")
+
+    # Function: merge_database
+    #
+    # Append the contents of another converter database to this one.
+    # The other database is attached and every table is copied with a single
+    # INSERT ... SELECT through a temporary old-id -> new-id map. New ids are
+    # numbered densely after the ids already present and foreign keys are
+    # translated through the map of the table they reference, so merging
+    # shards in order gives the same ids as converting their files serially.
+    # A component already present in this database (same vendor, library,
+    # name and version) is skipped together with all of its rows, as it would
+    # be rolled back by a serial conversion.
+    #
+    # Parameters:
+    #
+    #   other_db (str) - Path to a database created by <create_tables>
+    #
+    # Example:
+    #   converter.merge_database("shard_0.db")
+    def merge_database(self, other_db: str):
+        """Copy all rows of another converter database into this one."""
+        self.cursor.execute("ATTACH DATABASE ? AS shard", (other_db,))
+        try:
+            self.cursor.execute(
+                "SELECT s.name FROM shard.metadata s JOIN main.metadata m "
+                "ON m.vendor = s.vendor AND m.library = s.library "
+                "AND m.name = s.name AND m.version = s.version"
+            )
+            for (name,) in self.cursor.fetchall():
+                logger.warning(f"Skipping component {name} from {other_db}: already in database")
+
+            self.begin()
+            for table, fk_column, parent in _MERGE_TABLES:
+                self.cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM main.{table}")
+                offset = self.cursor.fetchone()[0]
+                if parent is None:
+                    keep = ("WHERE NOT EXISTS (SELECT 1 FROM main.metadata m "
+                            "WHERE m.vendor = t.vendor AND m.library = t.library "
+                            "AND m.name = t.name AND m.version = t.version)")
+                else:
+                    keep = f"WHERE t.{fk_column} IN (SELECT old FROM temp.merge_{parent})"
+                # New ids come from the INTEGER PRIMARY KEY: a placeholder row
+                # at the current maximum id makes the shard's rows, inserted
+                # in id order, follow it densely (no window functions, which
+                # need SQLite 3.25)
+                self.cursor.execute(
+                    f"CREATE TEMP TABLE merge_{table} (new INTEGER PRIMARY KEY, old INTEGER UNIQUE)"
+                )
+                self.cursor.execute(f"INSERT INTO temp.merge_{table} (new, old) VALUES (?, NULL)", (offset,))
+                self.cursor.execute(
+                    f"INSERT INTO temp.merge_{table} (old) "
+                    f"SELECT t.id FROM shard.{table} t {keep} ORDER BY t.id"
+                )
+                self.cursor.execute(f"DELETE FROM temp.merge_{table} WHERE old IS NULL")
+
+                columns = [row[1] for row in self.cursor.execute(f"PRAGMA shard.table_info({table})")]
+                exprs = []
+                for column in columns:
+                    if column == 'id':
+                        exprs.append("m.new")
+                    elif column == fk_column:
+                        exprs.append("p.new")
+                    else:
+                        exprs.append(f"t.{column}")
+                join = f" JOIN temp.merge_{parent} p ON p.old = t.{fk_column}" if parent else ""
+                self.cursor.execute(
+                    f"INSERT INTO main.{table} ({', '.join(columns)}) "
+                    f"SELECT {', '.join(exprs)} FROM shard.{table} t "
+                    f"JOIN temp.merge_{table} m ON m.old = t.id{join} ORDER BY t.id"
+                )
+            self.commit_all()
+            logger.debug(f"Merged database: {other_db}")
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+        finally:
+            for table, _, _ in _MERGE_TABLES:
+                self.cursor.execute(f"DROP TABLE IF EXISTS temp.merge_{table}")
+            self.cursor.execute("DETACH DATABASE shard")
+
+    # Function: process_files_parallel
+    #
+    # Convert a list of XML files using a pool of worker processes.
+    # The list is split into contiguous chunks; each worker converts its chunk
+    # into a private temporary database (see <_convert_shard>) so that the
+    # workers never contend for SQLite's writer lock. The shards are merged
+    # back in list order with <merge_database> and then deleted.
+    # A file that fails stops the run as in the serial loop of main(): the
+    # files before it are kept and its error is re-raised.
+    #
+    # Parameters:
+    #
+    #   xml_files (List[str]) - XML files to convert
+    #   jobs (int)            - Number of worker processes (default: CPU count)
+    #
+    # Example:
+    #   converter.process_files_parallel(["a.xml", "b.xml"], jobs=4)
+    def process_files_parallel(self, xml_files: List[str], jobs: Optional[int] = None):
+        """Convert XML files in worker processes and merge the results."""
+        if not xml_files:
+            return
+        jobs = max(1, min(jobs or os.cpu_count() or 1, len(xml_files)))
+        # A few chunks per worker keeps the pool busy when file sizes vary
+        n_chunks = min(len(xml_files), jobs * 4)
+        size, extra = divmod(len(xml_files), n_chunks)
+        chunks = []
+        start = 0
+        for i in range(n_chunks):
+            end = start + size + (1 if i < extra else 0)
+            chunks.append(xml_files[start:end])
+            start = end
+
+        shard_dir = tempfile.mkdtemp(prefix='xml_to_sqlite_')
+        try:
+            # Workers stamp metadata.created with this run's time, not their own
+            tasks = [(chunk, os.path.join(shard_dir, f"shard_{i}.db"), self.debug, self._run_ts)
+                     for i, chunk in enumerate(chunks)]
+            logger.info(f"Converting {len(xml_files)} file(s) with {jobs} worker(s)")
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = [pool.submit(_convert_shard, task) for task in tasks]
+                try:
+                    for future, (_, shard_path, _, _) in zip(futures, tasks):
+                        try:
+                            future.result()
+                        except Exception:
+                            # The shard holds the files of its chunk that
+                            # precede the failing one
+                            self.merge_database(shard_path)
+                            raise
+                        self.merge_database(shard_path)
+                finally:
+                    for future in futures:
+                        future.cancel()
+        finally:
+            shutil.rmtree(shard_dir, ignore_errors=True)
+
     # Function: calculate_checksum
     #
     # Calculate MD5 checksum of a file.
     # Used to verify file integrity and detect changes.
+    # The digest is cached per file (path, modification time and size), so a
+    # file holding several components is only read and hashed once.
     #
     # Parameters:
     #
@@ -178,13 +619,74 @@ class XMLToSQLite:
     #   print(f"File checksum: {checksum}")
     def calculate_checksum(self, file_path: str) -> str:
         """Calculate MD5 checksum of a file."""
-        with open(file_path, 'rb') as f:
-            return hashlib.md5(f.read()).hexdigest()
+        stat = os.stat(file_path)
+        key = (file_path, stat.st_mtime_ns, stat.st_size)
+        checksum = self._checksum_cache.get(key)
+        if checksum is None:
+            with open(file_path, 'rb') as f:
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: hash straight from the file buffer
+                    checksum = hashlib.file_digest(f, 'md5').hexdigest()
+                else:
+                    checksum = hashlib.md5(f.read()).hexdigest()
+            self._checksum_cache[key] = checksum
+        return checksum
+
+    # Function: _insert_many
+    #
+    # Insert a batch of rows with a single executemany call.
+    # Rows written by one statement receive consecutive rowids, so the IDs
+    # of the whole batch are derived from last_insert_rowid() instead of
+    # reading lastrowid after every row.
+    #
+    # Parameters:
+    #
+    #   sql  (str)         - INSERT statement with qmark placeholders
+    #   rows (List[tuple]) - Parameter tuples, one per row
+    #
+    # Returns:
+    #   range - IDs of the inserted rows in insertion order
+    def _insert_many(self, sql: str, rows: List[tuple]) -> range:
+        """Insert rows in one batch and return their IDs."""
+        if not rows:
+            return range(0)
+        self.cursor.executemany(sql, rows)
+        last_id = self.cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return range(last_id - len(rows) + 1, last_id + 1)
+
+    # Function: _descendants
+    #
+    # Return all descendants of root with the given local name, in any namespace.
+    # Equivalent to root.findall('.//{*}tag'), but the first call for a root
+    # indexes the whole subtree in a single pass, so the memory map, bus
+    # interface, port, parameter and vendor extension lookups on a component
+    # share one tree walk instead of each scanning the component again.
+    #
+    # Parameters:
+    #
+    #   root (ET.Element) - Element whose subtree is searched
+    #   tag (str)         - Local tag name to find
+    #
+    # Returns:
+    #   List[ET.Element] - Matching elements in document order
+    def _descendants(self, root: ET.Element, tag: str) -> List[ET.Element]:
+        """Find descendants by local name using a per-root index."""
+        if self._indexed_root is not root:
+            index: Dict[str, List[ET.Element]] = {}
+            elements = root.iter()
+            next(elements)  # Skip root itself, as './/' does
+            for elem in elements:
+                if isinstance(elem.tag, str):
+                    index.setdefault(elem.tag.rpartition('}')[2], []).append(elem)
+            self._element_index = index
+            self._indexed_root = root
+        return self._element_index.get(tag, [])
 
     # Function: get_text
     #
     # Get text content from XML element with namespace.
-    # Handles both IP-XACT and SPIRIT namespaces.
+    # Handles both IP-XACT and SPIRIT namespaces. With lxml the three
+    # candidate child paths of each tag are compiled once into XPath objects.
     #
     # Parameters:
     #
@@ -202,31 +704,148 @@ class XMLToSQLite:
     def get_text(self, element: ET.Element, tag: str, namespace: str = 'spirit') -> Optional[str]:
         """Get text content from XML element with namespace."""
         try:
-            # Build namespace dictionary
-            ns_dict = {'spirit': self.namespaces['spirit'], 'ipxact': self.namespaces['ipxact']}
+            paths = self._path_cache.get(tag)
+            if paths is None:
+                paths = (f'./spirit:{tag}', f'./ipxact:{tag}', f'./{tag}')
+                if HAVE_LXML:
+                    paths = tuple(ET.XPath(path, namespaces=self._ns_dict) for path in paths)
+                self._path_cache[tag] = paths
+
+            if HAVE_LXML:
+                # Compiled XPath per candidate, tried in the same order
+                found_elem = None
+                for xpath in paths:
+                    matches = xpath(element)
+                    if matches:
+                        found_elem = matches[0]
+                        break
+            else:
+                # Try direct child with namespace
+                found_elem = element.find(paths[0], self._ns_dict)
 
-            # Try direct child with namespace
-            found_elem = element.find(f'./spirit:{tag}', ns_dict)
+                # If not found with spirit namespace, try with ipxact namespace
+                if found_elem is None:
+                    found_elem = element.find(paths[1], self._ns_dict)
 
-            # If not found with spirit namespace, try with ipxact namespace
-            if found_elem is None:
-                found_elem = element.find(f'./ipxact:{tag}', ns_dict)
+                # If still not found, try without namespace prefix
+                if found_elem is None:
+                    found_elem = element.find(paths[2])
 
-            # If still not found, try without namespace prefix
             if found_elem is None:
-                found_elem = element.find(f'./{tag}')
-
-            if found_elem is None:
-                logger.debug(f"Tag {tag} not found in element {element.tag}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Tag {tag} not found in element {element.tag}")
                 return None
 
             text = found_elem.text
-            logger.debug(f"Found tag {tag} with text: {text}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Found tag {tag} with text: {text}")
             return text
         except (AttributeError, KeyError) as e:
             logger.debug(f"Error getting text for {tag}: {e}")
             return None
 
+    # Function: _child_texts
+    #
+    # Collect the text of all direct children of an element in one pass.
+    # Gives the same result as calling <get_text> once per tag: a SPIRIT child
+    # wins over an IP-XACT child, which wins over an un-namespaced child, and
+    # the first child in document order wins within the same namespace.
+    #
+    # Parameters:
+    #
+    #   element (ET.Element) - XML element whose children are read
+    #
+    # Returns:
+    #   Dict[str, Optional[str]] - Text content keyed by local tag name
+    def _child_texts(self, element: ET.Element) -> Dict[str, Optional[str]]:
+        """Map local tag name to text for the direct children of an element."""
+        texts: Dict[str, Optional[str]] = {}
+        ranks: Dict[str, int] = {}
+        ns_rank = self._text_ns_rank
+        for child in element:
+            tag = child.tag
+            if not isinstance(tag, str):
+                continue
+            if tag[0] == '{':
+                uri, _, local = tag[1:].partition('}')
+            else:
+                uri, local = '', tag
+            rank = ns_rank.get(uri)
+            if rank is None:
+                continue
+            best = ranks.get(local)
+            if best is None or rank < best:
+                ranks[local] = rank
+                texts[local] = child.text
+        return texts
+
+    # Function: _reset_value_mask
+    #
+    # Get the reset value and mask of a register or field.
+    # The reset is looked up among the element's own children, either
+    # directly (SPIRIT) or inside a resets wrapper (IP-XACT 2014), and its
+    # value and mask are read from the reset's direct children. A field's
+    # reset is therefore never mistaken for its register's.
+    #
+    # Parameters:
+    #
+    #   element (ET.Element) - Register or field element
+    #
+    # Returns:
+    #   Tuple[Optional[str], Optional[str]] - (value, mask) texts
+    def _reset_value_mask(self, element: ET.Element) -> Tuple[Optional[str], Optional[str]]:
+        """Return the reset value and mask texts of an element."""
+        reset = None
+        for child in element:
+            if not isinstance(child.tag, str):
+                continue
+            local = split_qname(child.tag)[1]
+            if local == 'reset':
+                reset = child
+            elif local == 'resets':
+                for candidate in child:
+                    if isinstance(candidate.tag, str) and split_qname(candidate.tag)[1] == 'reset':
+                        reset = candidate
+                        break
+            if reset is not None:
+                break
+        if reset is None:
+            return None, None
+
+        value = mask = None
+        have_value = have_mask = False
+        for child in reset:
+            if not isinstance(child.tag, str):
+                continue
+            local = split_qname(child.tag)[1]
+            if local == 'value' and not have_value:
+                value, have_value = child.text, True
+            elif local == 'mask' and not have_mask:
+                mask, have_mask = child.text, True
+        return value, mask
+
+    # Function: _nested_reset_value_mask
+    #
+    # Get the reset value and mask of the first reset anywhere below an
+    # element, typically a field's reset for a register that has none of
+    # its own (see <_reset_value_mask>).
+    #
+    # Parameters:
+    #
+    #   element (ET.Element) - Register element
+    #
+    # Returns:
+    #   Tuple[Optional[str], Optional[str]] - (value, mask) texts
+    def _nested_reset_value_mask(self, element: ET.Element) -> Tuple[Optional[str], Optional[str]]:
+        """Return the value and mask texts of the first nested reset."""
+        reset = element.find('.//{*}reset')
+        if reset is None:
+            return None, None
+        value_elem = reset.find('.//{*}value')
+        mask_elem = reset.find('.//{*}mask')
+        return (value_elem.text if value_elem is not None else None,
+                mask_elem.text if mask_elem is not None else None)
+
     # Function: insert_metadata
     #
     # Insert metadata into database.
@@ -262,17 +881,11 @@ class XMLToSQLite:
         checksum = self.calculate_checksum(file_path)
 
         # Insert metadata
-        self.cursor.execute('''
-            INSERT INTO metadata (
-                vendor, library, name, version, description, namespace,
-                schemaVersion, created, sourceFile, checksum
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        self.cursor.execute(_SQL_INSERT_METADATA, (
             vendor, library, name, version, description, namespace,
-            schema_version, datetime.now(), file_path, checksum
+            schema_version, self._run_ts, file_path, checksum
         ))
 
-        self.conn.commit()
         return self.cursor.lastrowid
 
 
@@ -287,20 +900,16 @@ class XMLToSQLite:
     #   metadata_id - ID of the metadata record
     def insert_memory_maps(self, root: ET.Element, metadata_id: int):
         """Insert memory maps into database."""
-        memory_maps = root.findall('.//{*}memoryMap')
+        memory_maps = self._descendants(root, 'memoryMap')
         if not memory_maps:
-            logger.info("No memory maps found in the XML file")
+            logger.debug("No memory maps found in the XML file")
             return
 
         for mm in memory_maps:
             name = self.get_text(mm, 'name') or ''
             description = self.get_text(mm, 'description')
 
-            self.cursor.execute('''
-                INSERT INTO memoryMaps (
-                    metadata_id, name, description
-                ) VALUES (?, ?, ?)
-            ''', (metadata_id, name, description))
+            self.cursor.execute(_SQL_INSERT_MEMORYMAPS, (metadata_id, name, description))
 
             mm_id = self.cursor.lastrowid
 
@@ -318,9 +927,10 @@ class XMLToSQLite:
         """Insert address blocks into database."""
         address_blocks = memory_map.findall('.//{*}addressBlock')
         if not address_blocks:
-            logger.info(f"No address blocks found in memory map ID {memory_map_id}")
+            logger.debug("No address blocks found in memory map ID %s", memory_map_id)
             return
 
+        rows = []
         for ab in address_blocks:
             name = self.get_text(ab, 'name') or ''
             description = self.get_text(ab, 'description')
@@ -329,28 +939,23 @@ class XMLToSQLite:
             width = None
             width_text = self.get_text(ab, 'width')
             if width_text:
-                try:
-                    width = int(width_text)
-                except ValueError:
+                width = _parse_int(width_text)
+                if width is None:
                     logger.warning(f"Invalid width value: {width_text}, using NULL")
             else:
                 width = 32  # Default value
 
             usage = self.get_text(ab, 'usage')
 
-            self.cursor.execute('''
-                INSERT INTO addressBlocks (
-                    memoryMap_id, name, description, baseAddress,
-                    range, width, usage
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            rows.append((
                 memory_map_id, name, description, base_address,
                 range_val, width, usage
             ))
 
-            ab_id = self.cursor.lastrowid
+        ab_ids = self._insert_many(_SQL_INSERT_ADDRESSBLOCKS, rows)
 
-            # Process registers
+        # Process registers
+        for ab, ab_id in zip(address_blocks, ab_ids):
             self.insert_registers(ab, ab_id)
 
     # Function: insert_registers
@@ -363,93 +968,91 @@ class XMLToSQLite:
     def insert_registers(self, address_block: ET.Element, address_block_id: int):
         """Insert registers into database."""
         # Find registers with explicit namespace
-        ns_dict = {'spirit': self.namespaces['spirit'], 'ipxact': self.namespaces['ipxact']}
-        registers = address_block.findall('./spirit:register', ns_dict)
+        registers = address_block.findall('./spirit:register', self._ns_dict)
 
         if not registers:
             # Try alternate approach
             registers = address_block.findall('.//{*}register')
 
         if not registers:
-            logger.info(f"No registers found in address block ID {address_block_id}")
+            logger.debug("No registers found in address block ID %s", address_block_id)
             return
 
+        # Checked once so the per-register debug output costs nothing when disabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        rows = []
+        names = []
         for reg in registers:
-            logger.debug(f"Processing register: {ET.tostring(reg, encoding='unicode')[:100]}...")
+            if debug:
+                logger.debug("Processing register: %s...", ET.tostring(reg, encoding='unicode')[:100])
             name = self.get_text(reg, 'name') or ''
-            logger.debug(f"Register name: {name}")
+            if debug:
+                logger.debug("Register name: %s", name)
             description = self.get_text(reg, 'description')
             address_offset = self.get_text(reg, 'addressOffset') or '0'
 
             size = None
             size_text = self.get_text(reg, 'size')
             if size_text:
-                try:
-                    size = int(size_text)
-                except ValueError:
+                size = _parse_int(size_text)
+                if size is None:
                     logger.warning(f"Invalid size value: {size_text}, using NULL")
             else:
                 size = 32  # Default value
 
             access = self.get_text(reg, 'access')
-            if access not in ('read-only', 'write-only', 'read-write', 'writeOnce', 'read-writeOnce', None):
+            if access not in _VALID_ACCESS:
                 logger.warning(f"Invalid access value: {access}, using NULL")
                 access = None
 
             volatile_text = self.get_text(reg, 'volatile')
-            volatile = None
-            if volatile_text is not None:
-                volatile = volatile_text.lower() == 'true'
+            volatile = _parse_bool(volatile_text)
 
             # Extract reset value and mask from register
-            resetValue = None
-            resetMask = None
-            reset = reg.find('.//{*}reset')
-            if reset is not None:
-                reset_value_elem = reset.find('.//{*}value')
-                if reset_value_elem is not None and reset_value_elem.text:
-                    resetValue = reset_value_elem.text
-
-                reset_mask_elem = reset.find('.//{*}mask')
-                if reset_mask_elem is not None and reset_mask_elem.text:
-                    resetMask = reset_mask_elem.text
+            resetValue, resetMask = self._reset_value_mask(reg)
+            if resetValue is None and resetMask is None:
+                # No reset of its own, as usual in IP-XACT 2014 where resets
+                # sit on the fields: take the first one below the register.
+                # Consumers such as svdb_dynamic_reg.sv need a resetValue.
+                resetValue, resetMask = self._nested_reset_value_mask(reg)
+            resetValue = resetValue or None
+            resetMask = resetMask or None
 
             # Set UVM-specific defaults
             rand = False  # Default to False
 
-            logger.debug(f"Inserting register: name={name}, offset={address_offset}, size={size}, access={access}, resetValue={resetValue}, resetMask={resetMask}")
-            self.cursor.execute('''
-                INSERT INTO registers (
-                    addressBlock_id, name, description, addressOffset,
-                    size, access, volatile, resetValue, resetMask, rand
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            if debug:
+                logger.debug("Inserting register: name=%s, offset=%s, size=%s, access=%s, resetValue=%s, resetMask=%s",
+                             name, address_offset, size, access, resetValue, resetMask)
+            rows.append((
                 address_block_id, name, description, address_offset,
                 size, access, volatile, resetValue, resetMask, rand
             ))
+            names.append(name)
+
+        reg_ids = self._insert_many(_SQL_INSERT_REGISTERS, rows)
 
-            reg_id = self.cursor.lastrowid
-            logger.debug(f"Inserted register with ID: {reg_id}")
+        block_fields: List[ET.Element] = []
+        block_field_rows: List[tuple] = []
+        vext_rows: List[tuple] = []
+        for reg, reg_id, name in zip(registers, reg_ids, names):
+            if debug:
+                logger.debug("Inserted register with ID: %s", reg_id)
             # Process vendor extensions for this register
             vendor_extensions = reg.find('.//{*}vendorExtensions')
             if vendor_extensions is not None:
                 for extension in vendor_extensions:
-                    if not isinstance(extension, ET.Element):
+                    if not isinstance(extension.tag, str):
                         continue
-                    vendor_id = 'unknown'
-                    if '}' in extension.tag:
-                        try:
-                            vendor_id = extension.tag.split('}')[0].strip('{')
-                        except Exception:
-                            logger.warning(f"Could not extract vendor ID from tag: {extension.tag}")
-                    tag_name = extension.tag.split('}')[-1] if '}' in extension.tag else extension.tag
+                    vendor_id, tag_name = split_qname(extension.tag)
+                    vendor_id = vendor_id or 'unknown'
                     # Key encodes register name for round-trip
                     key = f"register:{name}:{tag_name}"
                     try:
-                        if extension.text and not list(extension):
+                        if extension.text and len(extension) == 0:
                             value = extension.text
                         else:
-                            value = ET.tostring(extension, encoding='unicode')
+                            value = _element_xml(extension)
                     except Exception as e:
                         logger.warning(f"Error processing vendor extension: {e}")
                         value = ''
@@ -458,14 +1061,17 @@ class XMLToSQLite:
                     # (address_block -> memory_map -> component)
                     # But here, pass it as an argument or store it in self if needed
                     # For now, assume self.current_metadata_id is set during processing
-                    self.cursor.execute('''
-                        INSERT INTO vendorExtensions (
-                            metadata_id, vendorId, key, value
-                        ) VALUES (?, ?, ?, ?)
-                    ''', (self.current_metadata_id, vendor_id, key, value))
+                    vext_rows.append((self.current_metadata_id, vendor_id, key, value))
+
+            # Collect fields; they are written once for the whole address block
+            fields, field_rows = self._collect_fields(reg, reg_id)
+            block_fields.extend(fields)
+            block_field_rows.extend(field_rows)
 
-            # Process fields
-            self.insert_fields(reg, reg_id)
+        # Vendor extensions of the whole address block in one executemany
+        if vext_rows:
+            self.cursor.executemany(_SQL_INSERT_VENDOREXT, vext_rows)
+        self._write_fields(block_fields, block_field_rows)
 
     # Function: insert_fields
     #
@@ -477,109 +1083,135 @@ class XMLToSQLite:
     #   register_id - ID of the register
     def insert_fields(self, register: ET.Element, register_id: int):
         """Insert fields into database."""
+        fields, rows = self._collect_fields(register, register_id)
+        self._write_fields(fields, rows)
+
+    # Function: _collect_fields
+    #
+    # Build the fields table rows of a register without inserting them.
+    # Lets <insert_registers> write the fields of a whole address block
+    # with one <_write_fields> call.
+    #
+    # Parameters:
+    #
+    #   register - Register XML element
+    #   register_id - ID of the register
+    #
+    # Returns:
+    #   Tuple[List[ET.Element], List[tuple]] - Field elements and their rows
+    def _collect_fields(self, register: ET.Element, register_id: int) -> Tuple[List[ET.Element], List[tuple]]:
+        """Build field rows for a register."""
         # Find fields with explicit namespace
-        ns_dict = {'spirit': self.namespaces['spirit'], 'ipxact': self.namespaces['ipxact']}
-        fields = register.findall('./spirit:field', ns_dict)
+        fields = register.findall('./spirit:field', self._ns_dict)
 
         if not fields:
             # Try alternate approach
             fields = register.findall('.//{*}field')
 
         if not fields:
-            logger.info(f"No fields found in register ID {register_id}")
-            return
+            logger.debug("No fields found in register ID %s", register_id)
+            return [], []
 
+        # Checked once so the per-field debug output costs nothing when disabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        rows = []
         for field in fields:
-            logger.debug(f"Processing field: {ET.tostring(field, encoding='unicode')[:100]}...")
+            if debug:
+                logger.debug("Processing field: %s...", ET.tostring(field, encoding='unicode')[:100])
             # Extract all possible columns from the schema
-            name = self.get_text(field, 'name') or ''
-            logger.debug(f"Field name: {name}")
-            description = self.get_text(field, 'description')
-            displayName = self.get_text(field, 'displayName')
+            texts = self._child_texts(field)
+            name = texts.get('name') or ''
+            if debug:
+                logger.debug("Field name: %s", name)
+            description = texts.get('description')
+            displayName = texts.get('displayName')
 
             # Handle required numeric fields
             bitOffset = None
-            bitOffset_text = self.get_text(field, 'bitOffset')
+            bitOffset_text = texts.get('bitOffset')
             if bitOffset_text:
-                try:
-                    bitOffset = int(bitOffset_text)
-                except ValueError:
+                bitOffset = _parse_int(bitOffset_text)
+                if bitOffset is None:
                     logger.warning(f"Invalid bitOffset value: {bitOffset_text}, using NULL")
 
             bitWidth = None
-            bitWidth_text = self.get_text(field, 'bitWidth')
+            bitWidth_text = texts.get('bitWidth')
             if bitWidth_text:
-                try:
-                    bitWidth = int(bitWidth_text)
-                except ValueError:
+                bitWidth = _parse_int(bitWidth_text)
+                if bitWidth is None:
                     logger.warning(f"Invalid bitWidth value: {bitWidth_text}, using NULL")
 
-            access = self.get_text(field, 'access')
-            if access not in ('read-only', 'write-only', 'read-write', 'writeOnce', 'read-writeOnce', None):
+            access = texts.get('access')
+            if access not in _VALID_ACCESS:
                 logger.warning(f"Invalid access value: {access}, using NULL")
                 access = None
 
-            logger.debug(f"Inserting field: name={name}, bitOffset={bitOffset}, bitWidth={bitWidth}, access={access}")
+            if debug:
+                logger.debug("Inserting field: name=%s, bitOffset=%s, bitWidth=%s, access=%s",
+                             name, bitOffset, bitWidth, access)
 
-            resetTypeRef = self.get_text(field, 'resetTypeRef')
-            resetTrigger = self.get_text(field, 'resetTrigger')
-            resetPolarity = self.get_text(field, 'resetPolarity')
-            resetSynchronization = self.get_text(field, 'resetSynchronization')
-            resetDomain = self.get_text(field, 'resetDomain')
-            resetDependency = self.get_text(field, 'resetDependency')
-            resetSequence = self.get_text(field, 'resetSequence')
-            resetMask = None
+            resetTypeRef = texts.get('resetTypeRef')
+            resetTrigger = texts.get('resetTrigger')
+            resetPolarity = texts.get('resetPolarity')
+            resetSynchronization = texts.get('resetSynchronization')
+            resetDomain = texts.get('resetDomain')
+            resetDependency = texts.get('resetDependency')
+            resetSequence = texts.get('resetSequence')
 
             # Get reset value if exists
-            resetValue = None
-            reset = field.find('.//{*}reset')
-            if reset is not None:
-                resetValue = self.get_text(reset, 'value')
-                resetMask = self.get_text(reset, 'mask')
+            resetValue, resetMask = self._reset_value_mask(field)
 
             # Convert boolean values
-            isVolatile = None
-            isVolatile_text = self.get_text(field, 'volatile')
-            if isVolatile_text is not None:
-                isVolatile = isVolatile_text.lower() == 'true'
-
-            isReserved = None
-            isReserved_text = self.get_text(field, 'reserved')
-            if isReserved_text is not None:
-                isReserved = isReserved_text.lower() == 'true'
-
-            modifiedWriteValue = self.get_text(field, 'modifiedWriteValue')
-            readAction = self.get_text(field, 'readAction')
-            writeValueConstraint = self.get_text(field, 'writeValueConstraint')
-            testable = self.get_text(field, 'testable')
-            isPresent = self.get_text(field, 'isPresent')
-            dependence = self.get_text(field, 'dependence')
-            typeIdentifier = self.get_text(field, 'typeIdentifier')
-            enumValuesRef = self.get_text(field, 'enumValuesRef')
-            longDescription = self.get_text(field, 'longDescription')
-            groupName = self.get_text(field, 'groupName')
-            displayGroup = self.get_text(field, 'displayGroup')
-            alternateGroups = self.get_text(field, 'alternateGroups')
-            usage = self.get_text(field, 'usage')
-            enumName = self.get_text(field, 'enumName')
-            enumValue = self.get_text(field, 'enumValue')
-            enumDisplayName = self.get_text(field, 'enumDisplayName')
+            isVolatile_text = texts.get('volatile')
+            isVolatile = _parse_bool(isVolatile_text)
+
+            isReserved_text = texts.get('reserved')
+            isReserved = _parse_bool(isReserved_text)
+
+            modifiedWriteValue = texts.get('modifiedWriteValue')
+            readAction = texts.get('readAction')
+            writeValueConstraint = texts.get('writeValueConstraint')
+            testable = texts.get('testable')
+            isPresent = texts.get('isPresent')
+            dependence = texts.get('dependence')
+            typeIdentifier = texts.get('typeIdentifier')
+            enumValuesRef = texts.get('enumValuesRef')
+            longDescription = texts.get('longDescription')
+            groupName = texts.get('groupName')
+            displayGroup = texts.get('displayGroup')
+            alternateGroups = texts.get('alternateGroups')
+            usage = texts.get('usage')
+            enumName = texts.get('enumName')
+            enumValue = texts.get('enumValue')
+            enumDisplayName = texts.get('enumDisplayName')
 
             # Set UVM-specific defaults
             rand = False  # Default to False
             mirror = 0  # Default to 0 (integer)
             volatile = isVolatile  # Use the same value as isVolatile
 
-            self.cursor.execute('''
-                INSERT INTO fields (
-                    register_id, name, description, displayName, bitOffset, bitWidth, access, resetValue, resetTypeRef, resetTrigger, resetPolarity, resetSynchronization, resetDomain, resetDependency, resetSequence, resetMask, isVolatile, isReserved, modifiedWriteValue, readAction, writeValueConstraint, testable, isPresent, dependence, typeIdentifier, enumValuesRef, longDescription, groupName, displayGroup, alternateGroups, usage, enumName, enumValue, enumDisplayName, rand, mirror, volatile
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            rows.append((
                 register_id, name, description, displayName, bitOffset, bitWidth, access, resetValue, resetTypeRef, resetTrigger, resetPolarity, resetSynchronization, resetDomain, resetDependency, resetSequence, resetMask, isVolatile, isReserved, modifiedWriteValue, readAction, writeValueConstraint, testable, isPresent, dependence, typeIdentifier, enumValuesRef, longDescription, groupName, displayGroup, alternateGroups, usage, enumName, enumValue, enumDisplayName, rand, mirror, volatile
             ))
 
-            # Process enumerations if they exist
-            self.insert_enumerations(field, self.cursor.lastrowid)
+        return fields, rows
+
+    # Function: _write_fields
+    #
+    # Insert field rows built by <_collect_fields> with one executemany,
+    # then the enumerations of each field.
+    #
+    # Parameters:
+    #
+    #   fields - Field XML elements
+    #   rows - Matching fields table rows
+    def _write_fields(self, fields: List[ET.Element], rows: List[tuple]):
+        """Insert collected field rows and their enumerations."""
+        field_ids = self._insert_many(_SQL_INSERT_FIELDS, rows)
+
+        # Process enumerations if they exist
+        for field, field_id in zip(fields, field_ids):
+            self.insert_enumerations(field, field_id)
 
     # Function: insert_bus_interfaces
     #
@@ -591,9 +1223,9 @@ class XMLToSQLite:
     #   metadata_id - ID of the metadata record
     def insert_bus_interfaces(self, root: ET.Element, metadata_id: int):
         """Insert bus interfaces into database."""
-        bus_interfaces = root.findall('.//{*}busInterface')
+        bus_interfaces = self._descendants(root, 'busInterface')
         if not bus_interfaces:
-            logger.info("No bus interfaces found in the XML file")
+            logger.debug("No bus interfaces found in the XML file")
             return
 
         for bi in bus_interfaces:
@@ -603,24 +1235,24 @@ class XMLToSQLite:
             # Get busType
             bus_type_elem = bi.find('.//{*}busType')
             if bus_type_elem is not None:
-                vendor = bus_type_elem.get('vendor', '')
-                library = bus_type_elem.get('library', '')
-                name_attr = bus_type_elem.get('name', '')
-                version = bus_type_elem.get('version', '')
-                bus_type = f"{vendor}:{library}:{name_attr}:{version}"
+                attrs = bus_type_elem.attrib
+                bus_type = ':'.join((
+                    attrs.get('vendor', ''), attrs.get('library', ''),
+                    attrs.get('name', ''), attrs.get('version', '')
+                ))
 
             abstraction_type = ''
             # Get abstractionType
             abstraction_type_elem = bi.find('.//{*}abstractionType')
             if abstraction_type_elem is not None:
-                vendor = abstraction_type_elem.get('vendor', '')
-                library = abstraction_type_elem.get('library', '')
-                name_attr = abstraction_type_elem.get('name', '')
-                version = abstraction_type_elem.get('version', '')
-                abstraction_type = f"{vendor}:{library}:{name_attr}:{version}"
+                attrs = abstraction_type_elem.attrib
+                abstraction_type = ':'.join((
+                    attrs.get('vendor', ''), attrs.get('library', ''),
+                    attrs.get('name', ''), attrs.get('version', '')
+                ))
 
             interface_mode = self.get_text(bi, 'interfaceMode')
-            if interface_mode not in ('master', 'slave', 'system', None):
+            if interface_mode not in _VALID_IFMODE:
                 logger.warning(f"Invalid interfaceMode value: {interface_mode}, using NULL")
                 interface_mode = None
 
@@ -628,16 +1260,112 @@ class XMLToSQLite:
             is_present = self.get_text(bi, 'isPresent')
             initiative = self.get_text(bi, 'initiative')
 
-            self.cursor.execute('''
-                INSERT INTO busInterfaces (
-                    metadata_id, name, busType, abstractionType, interfaceMode,
-                    displayName, isPresent, initiative
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            self.cursor.execute(_SQL_INSERT_BUSINTERFACES, (
                 metadata_id, name, bus_type, abstraction_type, interface_mode,
                 display_name, is_present, initiative
             ))
 
+    # Function: _index_parameters
+    #
+    # Map parameterId to value for every parameter of a component.
+    # The map is built once per component root and reused by later callers,
+    # see <insert_ports>.
+    #
+    # Parameters:
+    #
+    #   root (ET.Element) - Component root element
+    #
+    # Returns:
+    #   Dict[str, str] - Parameter values keyed by parameterId
+    def _index_parameters(self, root: ET.Element) -> Dict[str, str]:
+        """Return the parameterId -> value map of a component."""
+        if self._parameters_root is not root:
+            parameters = {}
+            for param in self._descendants(root, 'parameter'):
+                param_id = param.get('parameterId')
+                if param_id:
+                    param_name = self.get_text(param, 'name')
+                    param_value = self.get_text(param, 'value')
+                    if param_name and param_value:
+                        parameters[param_id] = param_value
+                        logger.debug(f"Found parameter: {param_id} = {param_name} = {param_value}")
+            self._parameters_cache = parameters
+            # Decimal values, negative ones included, are converted once here
+            # so that port widths resolve with a dict lookup (isdigit() alone
+            # also accepts digits such as '²' that int() rejects)
+            self._param_int = {}
+            for param_id, value in parameters.items():
+                digits = value[1:] if value[:1] == '-' else value
+                if digits.isascii() and digits.isdigit():
+                    self._param_int[param_id] = int(value)
+            # Widths cached for another root were resolved against its parameters
+            self._width_cache = {}
+            self._parameters_root = root
+        return self._parameters_cache
+
+    # Function: _vector_width
+    #
+    # Compute a port width from its vector bounds.
+    # Bounds are integers or parameter references of the form 'uuid_x' or
+    # 'uuid_x-1'; references are resolved through the integer parameter
+    # values indexed by <_index_parameters>.
+    #
+    # Parameters:
+    #
+    #   left (str)       - Left vector bound
+    #   right (str)      - Right vector bound
+    #   name (str)       - Port name, for log messages
+    #   parameters (Dict[str, str]) - Parameter values keyed by parameterId
+    #
+    # Returns:
+    #   Optional[int] - Width, or None if the bounds cannot be resolved
+    def _vector_width(self, left: str, right: str, name: str, parameters: Dict[str, str]) -> Optional[int]:
+        """Resolve vector bounds to a port width."""
+        try:
+            # Try direct conversion to integers
+            left_val = int(left)
+            right_val = int(right)
+            return abs(left_val - right_val) + 1
+        except ValueError:
+            pass
+
+        # Check if bounds are parameter references (UUIDs)
+        param_int = self._param_int
+        try:
+            # Extract UUID from left value if it's a parameter reference
+            if left.startswith('uuid_'):
+                uuid_part, minus, _ = left.partition('-')  # Remove the "-1" suffix if present
+                if uuid_part in parameters:
+                    left_val = param_int.get(uuid_part)
+                    if left_val is None:
+                        left_val = int(parameters[uuid_part])
+                    if minus:  # If format is "uuid-1", subtract 1
+                        left_val = left_val - 1
+                else:
+                    logger.warning("Parameter reference not found: %s", uuid_part)
+                    left_val = 0
+            else:
+                left_val = 0
+
+            # Right value is typically 0
+            if right.startswith('uuid_'):
+                uuid_part = right.partition('-')[0]
+                if uuid_part in parameters:
+                    right_val = param_int.get(uuid_part)
+                    if right_val is None:
+                        right_val = int(parameters[uuid_part])
+                else:
+                    right_val = 0
+            else:
+                right_val = int(right)
+
+            width = abs(left_val - right_val) + 1
+            logger.debug("Resolved parameter reference for port %s: width=%s", name, width)
+            return width
+        except Exception as e:
+            logger.warning("Invalid vector bounds for port %s: left=%s, right=%s, error=%s", name, left, right, e)
+            return None
+
     # Function: insert_ports
     #
     # Insert ports into database.
@@ -648,25 +1376,22 @@ class XMLToSQLite:
     #   metadata_id - ID of the metadata record
     def insert_ports(self, root: ET.Element, metadata_id: int):
         """Insert ports into database."""
-        ports = root.findall('.//{*}port')
+        ports = self._descendants(root, 'port')
         if not ports:
-            logger.info("No ports found in the XML file")
+            logger.debug("No ports found in the XML file")
             return
 
-        # Extract parameters first to resolve parameter references in vectors
-        parameters = {}
-        for param in root.findall('.//{*}parameter'):
-            param_id = param.get('parameterId')
-            if param_id:
-                param_name = self.get_text(param, 'name')
-                param_value = self.get_text(param, 'value')
-                if param_name and param_value:
-                    parameters[param_id] = param_value
-                    logger.debug(f"Found parameter: {param_id} = {param_name} = {param_value}")
+        # Parameter values to resolve parameter references in vectors
+        parameters = self._index_parameters(root)
 
+        # Checked once so the per-port debug output costs nothing when disabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        rows = []
         for port in ports:
-            name = self.get_text(port, 'name') or ''
-            description = self.get_text(port, 'description')
+            # Direct children of the port in one pass
+            texts = self._child_texts(port)
+            name = texts.get('name') or ''
+            description = texts.get('description')
 
             # Get direction from wire element
             direction = None
@@ -682,23 +1407,21 @@ class XMLToSQLite:
 
             # If direction is still None, try the old way
             if direction is None:
-                direction = self.get_text(port, 'direction')
+                direction = texts.get('direction')
 
             # If we still don't have a direction, use a default
             if direction is None:
-                logger.warning(f"No direction found for port {name}, using 'in' as default")
+                logger.warning("No direction found for port %s, using 'in' as default", name)
                 direction = 'in'
+            # Only a handful of distinct values; share one string object per value
+            direction = sys.intern(direction)
 
             # Handle boolean values
-            is_address = None
-            is_address_text = self.get_text(port, 'isAddress')
-            if is_address_text is not None:
-                is_address = is_address_text.lower() == 'true'
+            is_address_text = texts.get('isAddress')
+            is_address = _parse_bool(is_address_text)
 
-            is_data = None
-            is_data_text = self.get_text(port, 'isData')
-            if is_data_text is not None:
-                is_data = is_data_text.lower() == 'true'
+            is_data_text = texts.get('isData')
+            is_data = _parse_bool(is_data_text)
 
             # Get width
             width = None
@@ -708,57 +1431,26 @@ class XMLToSQLite:
                     left = self.get_text(vector, 'left')
                     right = self.get_text(vector, 'right')
                     if left is not None and right is not None:
-                        try:
-                            # Try direct conversion to integers
-                            left_val = int(left)
-                            right_val = int(right)
-                            width = abs(left_val - right_val) + 1
-                        except ValueError:
-                            # Check if bounds are parameter references (UUIDs)
-                            try:
-                                # Extract UUID from left value if it's a parameter reference
-                                if 'uuid_' in left:
-                                    uuid_part = left.split('-')[0]  # Remove the "-1" suffix if present
-                                    if uuid_part in parameters:
-                                        left_param_value = parameters[uuid_part]
-                                        left_val = int(left_param_value)
-                                        if '-' in left:  # If format is "uuid-1", subtract 1
-                                            left_val = left_val - 1
-                                    else:
-                                        logger.warning(f"Parameter reference not found: {uuid_part}")
-                                        left_val = 0
-                                else:
-                                    left_val = 0
-
-                                # Right value is typically 0
-                                if 'uuid_' in right:
-                                    uuid_part = right.split('-')[0]
-                                    if uuid_part in parameters:
-                                        right_val = int(parameters[uuid_part])
-                                    else:
-                                        right_val = 0
-                                else:
-                                    right_val = int(right)
-
-                                width = abs(left_val - right_val) + 1
-                                logger.debug(f"Resolved parameter reference for port {name}: width={width}")
-                            except Exception as e:
-                                logger.warning(f"Invalid vector bounds for port {name}: left={left}, right={right}, error={e}")
-
-            display_name = self.get_text(port, 'displayName')
-
-            logger.debug(f"Inserting port: name={name}, direction={direction}, width={width}")
-
-            self.cursor.execute('''
-                INSERT INTO ports (
-                    metadata_id, name, description, direction, isAddress,
-                    isData, width, displayName
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+                        # Identical bounds are common across ports; resolve once
+                        key = (left, right)
+                        if key in self._width_cache:
+                            width = self._width_cache[key]
+                        else:
+                            width = self._vector_width(left, right, name, parameters)
+                            self._width_cache[key] = width
+
+            display_name = texts.get('displayName')
+
+            if debug:
+                logger.debug("Inserting port: name=%s, direction=%s, width=%s", name, direction, width)
+
+            rows.append((
                 metadata_id, name, description, direction, is_address,
                 is_data, width, display_name
             ))
 
+        self.cursor.executemany(_SQL_INSERT_PORTS, rows)
+
     # Function: insert_parameters
     #
     # Insert parameters into database.
@@ -769,41 +1461,43 @@ class XMLToSQLite:
     #   metadata_id - ID of the metadata record
     def insert_parameters(self, root: ET.Element, metadata_id: int):
         """Insert parameters into database."""
-        parameters = root.findall('.//{*}parameter')
+        parameters = self._descendants(root, 'parameter')
         if not parameters:
-            logger.info("No parameters found in the XML file")
+            logger.debug("No parameters found in the XML file")
             return
 
+        # Parameters owned by the component: those of its <parameters>
+        # container. Anything else is local (the schema only allows
+        # component/global/local scopes). Found from the top down, as
+        # ElementTree has no getparent().
+        component_params = set()
+        if split_qname(root.tag)[1] == 'component':
+            for child in root:
+                local = split_qname(child.tag)[1] if isinstance(child.tag, str) else None
+                if local == 'parameters':
+                    component_params.update(child)
+                elif local == 'parameter':
+                    component_params.add(child)
+
+        rows = []
         for param in parameters:
-            name = self.get_text(param, 'name') or ''
-            display_name = self.get_text(param, 'displayName')
-            value = self.get_text(param, 'value')
-            description = self.get_text(param, 'description')
-            data_type = self.get_text(param, 'dataType') or 'string'
-
-            # Determine if component parameter or other scope
-            scope = 'component'
-            try:
-                parent = param.getparent()
-                if parent is not None:
-                    parent_tag = parent.tag.split('}')[-1]
-                    if parent_tag != 'component':
-                        scope = parent_tag
-            except AttributeError:
-                # ElementTree in standard library doesn't have getparent()
-                # Just use default scope
-                pass
-
-            self.cursor.execute('''
-                INSERT INTO parameters (
-                    metadata_id, name, displayName, value, description,
-                    type, scope
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            # Direct children of the parameter in one pass
+            texts = self._child_texts(param)
+            name = texts.get('name') or ''
+            display_name = texts.get('displayName')
+            value = texts.get('value')
+            description = texts.get('description')
+            data_type = sys.intern(texts.get('dataType') or 'string')
+
+            scope = 'component' if param in component_params else 'local'
+
+            rows.append((
                 metadata_id, name, display_name, value, description,
                 data_type, scope
             ))
 
+        self.cursor.executemany(_SQL_INSERT_PARAMETERS, rows)
+
     # Function: insert_vendor_extensions
     #
     # Insert vendor extensions into database.
@@ -814,44 +1508,37 @@ class XMLToSQLite:
     #   metadata_id - ID of the metadata record
     def insert_vendor_extensions(self, root: ET.Element, metadata_id: int):
         """Insert vendor extensions into database."""
-        vendor_extensions = root.find('.//{*}vendorExtensions')
+        matches = self._descendants(root, 'vendorExtensions')
+        vendor_extensions = matches[0] if matches else None
         if vendor_extensions is None:
-            logger.info("No vendor extensions found in the XML file")
+            logger.debug("No vendor extensions found in the XML file")
             return
 
         # Process all child elements
+        rows = []
         for extension in vendor_extensions:
-            # Skip text nodes
-            if not isinstance(extension, ET.Element):
+            # Skip comments and processing instructions
+            if not isinstance(extension.tag, str):
                 continue
 
-            # Extract vendor ID from namespace or tag
-            vendor_id = 'unknown'
-            if '}' in extension.tag:
-                try:
-                    vendor_id = extension.tag.split('}')[0].strip('{')
-                except Exception:
-                    logger.warning(f"Could not extract vendor ID from tag: {extension.tag}")
-
-            # Use tag name as the key
-            tag_name = extension.tag.split('}')[-1] if '}' in extension.tag else extension.tag
+            # Vendor ID is the tag's namespace, the key is its local name
+            vendor_id, tag_name = split_qname(extension.tag)
+            vendor_id = vendor_id or 'unknown'
 
             # Extension value could be text or XML structure
             value = None
             try:
-                if extension.text and not list(extension):  # No children
+                if extension.text and len(extension) == 0:  # No children
                     value = extension.text
                 else:
                     # Convert complex structure to string
-                    value = ET.tostring(extension, encoding='unicode')
+                    value = _element_xml(extension)
             except Exception as e:
                 logger.warning(f"Error processing vendor extension: {e}")
 
-            self.cursor.execute('''
-                INSERT INTO vendorExtensions (
-                    metadata_id, vendorId, key, value
-                ) VALUES (?, ?, ?, ?)
-            ''', (metadata_id, vendor_id, tag_name, value))
+            rows.append((metadata_id, vendor_id, tag_name, value))
+
+        self.cursor.executemany(_SQL_INSERT_VENDOREXT, rows)
 
     # Function: insert_enumerations
     #
@@ -867,22 +1554,28 @@ class XMLToSQLite:
         if not enumerations:
             return  # Not logging as many fields don't have enumerations
 
+        rows = []
         for enum in enumerations:
-            name = self.get_text(enum, 'name') or ''
-            value = self.get_text(enum, 'value')
-            display_name = self.get_text(enum, 'displayName')
-            description = self.get_text(enum, 'description')
-            usage = self.get_text(enum, 'usage')
-
-            self.cursor.execute('''
-                INSERT INTO enumerations (
-                    field_id, name, value, displayName, description, usage
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            ''', (field_id, name, value, display_name, description, usage))
+            # Direct children of the enumerated value in one pass
+            texts = self._child_texts(enum)
+            name = texts.get('name') or ''
+            value = texts.get('value')
+            display_name = texts.get('displayName')
+            description = texts.get('description')
+            usage = texts.get('usage')
+
+            rows.append((field_id, name, value, display_name, description, usage))
+
+        self.cursor.executemany(_SQL_INSERT_ENUMERATIONS, rows)
 
     # Function: process_xml_file
     #
     # Process XML file and convert to SQLite database.
+    # Components are streamed from the file by <_iter_components>, so the
+    # file is parsed once and never held in memory as a whole. If the file
+    # turns out not to be well-formed, everything inserted from it so far is
+    # rolled back and the file is converted again wrapped in a synthetic root
+    # element, which accepts files holding several top-level components.
     #
     # Parameters:
     #
@@ -890,120 +1583,219 @@ class XMLToSQLite:
     def process_xml_file(self, xml_file: str):
         """Process a single XML file and insert its data into the database."""
         try:
-            logger.info(f"Processing XML file: {xml_file}")
-
-            # Read the XML content
-            with open(xml_file, 'r', encoding='utf-8') as f:
-                xml_content = f.read()
+            logger.debug("Processing XML file: %s", xml_file)
 
-            # Find all component elements in the file
-            # Look for both spirit and ipxact namespaces
-            spirit_components = self._extract_components(xml_content, 'spirit:component')
-            ipxact_components = self._extract_components(xml_content, 'ipxact:component')
-
-            # Combine all found components
-            all_components = spirit_components + ipxact_components
-
-            if not all_components:
+            self.cursor.execute("SAVEPOINT xml_file")
+            try:
+                count, n_ok = self._process_components(xml_file)
+            except ET.ParseError as e:
+                logger.warning(f"{xml_file} is not well-formed ({e}), retrying as a multi-component file")
+                self.cursor.execute("ROLLBACK TO SAVEPOINT xml_file")
+                count, n_ok = self._process_components(xml_file, wrap=True)
+            self.cursor.execute("RELEASE SAVEPOINT xml_file")
+
+            if not count:
                 logger.warning(f"No component elements found in {xml_file}")
                 return
 
-            logger.info(f"Found {len(all_components)} component(s) in {xml_file}")
-
-            # Process each component
-            for i, component_xml in enumerate(all_components):
-                try:
-                    # Parse the component XML
-                    component_root = ET.fromstring(component_xml)
-
-                    # Insert metadata and get metadata_id
-                    component_name = self.get_text(component_root, 'name') or f"component_{i}"
-                    logger.info(f"Processing component: {component_name} ({i+1}/{len(all_components)})")
-
-                    metadata_id = self.insert_metadata(component_root, xml_file)
-
-                    # Process memory maps
-                    # Set current_metadata_id for use in register/addressBlock vendorExtensions
-                    self.current_metadata_id = metadata_id
-                    self.insert_memory_maps(component_root, metadata_id)
-                    del self.current_metadata_id
-
-                    # Process bus interfaces
-                    self.insert_bus_interfaces(component_root, metadata_id)
-
-                    # Process ports
-                    self.insert_ports(component_root, metadata_id)
-
-                    # Process parameters
-                    self.insert_parameters(component_root, metadata_id)
-
-                    # Process vendor extensions
-                    self.insert_vendor_extensions(component_root, metadata_id)
-
-                    self.conn.commit()
-                    logger.info(f"Successfully processed component {i+1}/{len(all_components)}: {component_name}")
-
-                except Exception as e:
-                    logger.error(f"Error processing component {i+1}/{len(all_components)}: {e}")
-                    self.conn.rollback()
-
-            logger.info(f"Successfully processed {xml_file}")
+            # One summary line per file; per-component progress is logged at
+            # debug level only
+            if n_ok == count:
+                logger.info("Processed %d component(s) from %s", n_ok, xml_file)
+            else:
+                logger.info("Processed %d of %d component(s) from %s", n_ok, count, xml_file)
 
         except Exception as e:
             logger.error(f"Error processing {xml_file}: {e}")
             self.conn.rollback()
             raise
 
-    # Function: _extract_components
+    # Function: _process_components
     #
-    # Extract component elements from XML content.
+    # Insert every component of an XML file.
+    # Each component is isolated by a savepoint, so a failing component is
+    # logged and skipped without discarding the others.
     #
     # Parameters:
     #
-    #   xml_content - XML content as string
-    #   component_tag - Component tag name
-    # Returns: List of component elements
-    def _extract_components(self, xml_content: str, component_tag: str) -> list:
-        """Extract component XML sections from the content.
-
-        Args:
-            xml_content: The full XML content
-            component_tag: The component tag to search for (e.g., 'spirit:component' or 'ipxact:component')
-
-        Returns:
-            List of XML strings, each containing a complete component element
-        """
-        components = []
-
-        # Find all start positions of component tags
-        start_tag = f"<{component_tag}"
-        end_tag = f"</{component_tag}>"
-
-        start_pos = 0
-        while True:
-            start_pos = xml_content.find(start_tag, start_pos)
-            if start_pos == -1:
-                break
+    #   xml_file - Path to input XML file
+    #   wrap     - Parse the content inside a synthetic root (see <_iter_components>)
+    #
+    # Returns:
+    #   Tuple[int, int] - Number of components found and inserted
+    def _process_components(self, xml_file: str, wrap: bool = False) -> Tuple[int, int]:
+        """Insert all components of an XML file and return the found/inserted counts."""
+        count = 0
+        n_ok = 0
+        for i, component_root in enumerate(self._iter_components(xml_file, wrap)):
+            count += 1
+            # Each component is isolated by a savepoint so that a failing
+            # component does not discard the rest of the file's transaction
+            self.cursor.execute("SAVEPOINT component")
+            try:
+                # Insert metadata and get metadata_id
+                component_name = self.get_text(component_root, 'name') or f"component_{i}"
+                logger.debug("Processing component: %s (%d)", component_name, i + 1)
 
-            # Find the matching end tag
-            end_pos = xml_content.find(end_tag, start_pos)
-            if end_pos == -1:
-                logger.warning(f"Found start tag {start_tag} but no matching end tag")
-                break
+                metadata_id = self.insert_metadata(component_root, xml_file)
+                self._index_parameters(component_root)
+
+                # Process memory maps
+                # Set current_metadata_id for use in register/addressBlock vendorExtensions
+                self.current_metadata_id = metadata_id
+                self.insert_memory_maps(component_root, metadata_id)
+                del self.current_metadata_id
+
+                # Process bus interfaces
+                self.insert_bus_interfaces(component_root, metadata_id)
+
+                # Process ports
+                self.insert_ports(component_root, metadata_id)
 
-            # Extract the component XML including the end tag
-            component_xml = xml_content[start_pos:end_pos + len(end_tag)]
-            components.append(component_xml)
+                # Process parameters
+                self.insert_parameters(component_root, metadata_id)
 
-            # Move past this component for the next search
-            start_pos = end_pos + len(end_tag)
+                # Process vendor extensions
+                self.insert_vendor_extensions(component_root, metadata_id)
 
-        return components
+                self.cursor.execute("RELEASE SAVEPOINT component")
+                n_ok += 1
+                logger.debug("Successfully processed component %d: %s", i + 1, component_name)
+
+            except Exception as e:
+                logger.error(f"Error processing component {i+1}: {e}")
+                self.cursor.execute("ROLLBACK TO SAVEPOINT component")
+                self.cursor.execute("RELEASE SAVEPOINT component")
+
+            finally:
+                # Drop the descendant index so the component tree can be freed
+                self._indexed_root = None
+                self._element_index = {}
+                self._parameters_root = None
+                self._parameters_cache = {}
+                self._param_int = {}
+                self._width_cache = {}
+        return count, n_ok
+
+    # Function: _iter_components
+    #
+    # Stream the component elements of an XML file.
+    # Each SPIRIT or IP-XACT component element (see _COMPONENT_TAGS) is
+    # yielded as soon as its end tag has been parsed. When the caller moves
+    # on, the component's subtree and the siblings before it are released,
+    # so memory use is bounded by the largest component rather than the file.
+    # With wrap set, the file content is wrapped in a synthetic root
+    # element, which accepts files holding several top-level components.
+    # Broken markup is rejected either way.
+    #
+    # Parameters:
+    #
+    #   xml_file - Path to input XML file
+    #   wrap     - Parse the file content inside a synthetic root element
+    #
+    # Returns:
+    #   Iterator[ET.Element] - Component elements in document order
+    def _iter_components(self, xml_file: str, wrap: bool = False):
+        """Yield the component elements of an XML file."""
+        source = xml_file
+        if wrap:
+            source = io.BytesIO(b'<root>' + _read_xml_body(xml_file) + b'</root>')
+
+        if HAVE_LXML:
+            context = ET.iterparse(source, events=('end',), tag=_COMPONENT_TAGS, huge_tree=True)
+            for _, elem in context:
+                yield elem
+                elem.clear(keep_tail=False)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        else:
+            # ElementTree has no tag filter or getparent(); track the open
+            # elements to detach each component from its parent
+            stack = []
+            for event, elem in ET.iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    stack.append(elem)
+                    continue
+                stack.pop()
+                if elem.tag in _COMPONENT_TAGS:
+                    yield elem
+                    elem.clear()
+                    if stack:
+                        stack[-1].remove(elem)
+
+# Function: _read_xml_body
+#
+# Read an XML file as UTF-8 bytes without its XML declaration and document
+# type declaration, so that the content can be embedded in another document
+# (see <XMLToSQLite._iter_components>). Text in another declared encoding is
+# transcoded.
+#
+# Parameters:
+#
+#   xml_file (str) - Path to input XML file
+#
+# Returns:
+#   bytes - UTF-8 encoded document content
+def _read_xml_body(xml_file: str) -> bytes:
+    with open(xml_file, 'rb') as f:
+        data = f.read()
+    if data.startswith(b'\xef\xbb\xbf'):
+        data = data[3:]
+    declaration = _XML_DECLARATION.match(data)
+    if declaration:
+        declared = _XML_ENCODING.search(declaration.group(0))
+        data = data[declaration.end():]
+        if declared:
+            encoding = declared.group(1).decode('ascii')
+            if encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+                data = data.decode(encoding).encode('utf-8')
+    doctype = _XML_DOCTYPE.match(data)
+    if doctype:
+        data = data[:doctype.start(1)] + data[doctype.end(1):]
+    return data
+
+# Function: _convert_shard
+#
+# Worker entry point for <XMLToSQLite.process_files_parallel>.
+# Converts a chunk of XML files into its own database, committing once per
+# file as main() does. A file that fails is rolled back and its error is
+# re-raised, leaving the files before it in the shard.
+#
+# Parameters:
+#
+#   task (tuple) - (xml_files, shard_path, debug, run_ts), run_ts being the
+#                  creation time of the parent converter's run
+#
+# Returns:
+#   str - Path of the shard database
+def _convert_shard(task) -> str:
+    xml_files, shard_path, debug, run_ts = task
+    converter = XMLToSQLite(shard_path, debug)
+    try:
+        converter.connect()
+        converter._run_ts = run_ts
+        converter.create_tables()
+        for xml_file in xml_files:
+            if os.path.exists(xml_file):
+                converter.begin()
+                try:
+                    converter.process_xml_file(xml_file)
+                except Exception as e:
+                    # Not every exception pickles (lxml's parse errors hold
+                    # their error log), so pass the message on instead
+                    raise RuntimeError(str(e)) from None
+                converter.commit_all()
+            else:
+                logger.warning(f"File not found: {xml_file}")
+    finally:
+        converter.close()
+    return shard_path
 
 # Function: main
 #
 # Main entry point for the script.
-# Parses command line arguments and processes XML files.
+# Parses command line arguments (argv, or sys.argv[1:] when None) and
+# processes XML files.
 #
 # --- code
 # Command line arguments:
@@ -1011,22 +1803,30 @@ class XMLToSQLite:
 #   -f, --file-list - File containing list of XML files to process
 #   -o, --output - Output SQLite database path (required)
 #   -d, --debug - Enable debug logging
+#   -j, --jobs - Worker processes for a file list (default: 1, serial)
 #---
 #
 # Example usage:
 #   python xml_to_sqlite.py input.xml -o output.db
 #   python xml_to_sqlite.py -f file_list.txt -o output.db -d
-def main():
+#   python xml_to_sqlite.py -f file_list.txt -o output.db -j 8
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(description='Convert IP-XACT XML files to SQLite database')
     parser.add_argument('xml_file', nargs='?', help='Input XML file')
     parser.add_argument('-f', '--file-list', help='File containing list of XML files to process')
     parser.add_argument('-o', '--output', required=True, help='Output SQLite database path')
     parser.add_argument('-d', '--debug', action='store_true', help='Enable debug logging')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of worker processes used for a file list (default: 1)')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.xml_file and not args.file_list:
         parser.error("Either an XML file or a file list (-f) must be provided")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.jobs > 1 and not args.file_list:
+        logger.warning("--jobs only applies to a file list (-f); converting a single file serially")
 
     converter = XMLToSQLite(args.output, args.debug)
 
@@ -1037,13 +1837,23 @@ def main():
         if args.file_list:
             with open(args.file_list, 'r') as f:
                 xml_files = [line.strip() for line in f if line.strip()]
-            for xml_file in xml_files:
-                if os.path.exists(xml_file):
-                    converter.process_xml_file(xml_file)
-                else:
-                    logger.warning(f"File not found: {xml_file}")
+            if args.jobs > 1 and len(xml_files) > 1:
+                # Independent files are converted in worker processes
+                converter.process_files_parallel(xml_files, args.jobs)
+            else:
+                for xml_file in xml_files:
+                    if os.path.exists(xml_file):
+                        converter.begin()
+                        converter.process_xml_file(xml_file)
+                        converter.commit_all()
+                    else:
+                        logger.warning(f"File not found: {xml_file}")
         else:
+            converter.begin()
             converter.process_xml_file(args.xml_file)
+            converter.commit_all()
+
+        converter.analyze()
 
     except Exception as e:
         logger.error(f"Error: {e}")
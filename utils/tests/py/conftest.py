@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the scripts under utils/py importable by the tests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'py')))
@@ -1,11 +1,182 @@
-import subprocess
-import sys
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'examples',
+                       'example_registers.xml')
+
+COMPONENT = '''<spirit:component xmlns:spirit="http://www.spiritconsortium.org/XMLSchema/SPIRIT/1685-2009"
+    xmlns:kactus2="http://funbase.cs.tut.fi/">
+  <spirit:vendor>acme</spirit:vendor>
+  <spirit:library>lib</spirit:library>
+  <spirit:name>{name}</spirit:name>
+  <spirit:version>1.0</spirit:version>
+  <spirit:memoryMaps>
+    <spirit:memoryMap>
+      <spirit:name>mm0</spirit:name>
+      <spirit:addressBlock>
+        <spirit:name>ab0</spirit:name>
+        <spirit:baseAddress>0x0</spirit:baseAddress>
+        <spirit:range>0x100</spirit:range>
+        <spirit:width>32</spirit:width>
+        <spirit:register>
+          <spirit:name>{register}</spirit:name>
+          <spirit:addressOffset>0x4</spirit:addressOffset>
+          <spirit:size>32</spirit:size>
+          <spirit:field>
+            <spirit:name>F0</spirit:name>
+            <spirit:bitOffset>0</spirit:bitOffset>
+            <spirit:bitWidth>4</spirit:bitWidth>
+            <spirit:enumeratedValues>
+              <spirit:enumeratedValue><spirit:name>A</spirit:name><spirit:value>1</spirit:value></spirit:enumeratedValue>
+            </spirit:enumeratedValues>
+          </spirit:field>
+          <spirit:vendorExtensions><kactus2:note>{name}</kactus2:note></spirit:vendorExtensions>
+        </spirit:register>
+      </spirit:addressBlock>
+    </spirit:memoryMap>
+  </spirit:memoryMaps>
+  <spirit:model>
+    <spirit:ports>
+      <spirit:port><spirit:name>d</spirit:name><spirit:wire><spirit:direction>out</spirit:direction>
+        <spirit:vector><spirit:left>uuid_w-1</spirit:left><spirit:right>0</spirit:right></spirit:vector>
+      </spirit:wire></spirit:port>
+    </spirit:ports>
+  </spirit:model>
+  <spirit:parameters>
+    <spirit:parameter parameterId="uuid_w"><spirit:name>W</spirit:name><spirit:value>8</spirit:value></spirit:parameter>
+  </spirit:parameters>
+</spirit:component>
+'''
+
+# IP-XACT 2014 register whose only reset is on its field
+IPXACT_FIELD_RESET = '''<?xml version="1.0" encoding="UTF-8"?>
+<ipxact:component xmlns:ipxact="http://www.accellera.org/XMLSchema/IPXACT/1685-2014">
+  <ipxact:vendor>acme</ipxact:vendor>
+  <ipxact:library>lib</ipxact:library>
+  <ipxact:name>blk_2014</ipxact:name>
+  <ipxact:version>1.0</ipxact:version>
+  <ipxact:memoryMaps>
+    <ipxact:memoryMap>
+      <ipxact:name>mm0</ipxact:name>
+      <ipxact:addressBlock>
+        <ipxact:name>ab0</ipxact:name>
+        <ipxact:baseAddress>0x0</ipxact:baseAddress>
+        <ipxact:range>0x100</ipxact:range>
+        <ipxact:width>32</ipxact:width>
+        <ipxact:register>
+          <ipxact:name>CTRL</ipxact:name>
+          <ipxact:addressOffset>0x0</ipxact:addressOffset>
+          <ipxact:size>32</ipxact:size>
+          <ipxact:field>
+            <ipxact:name>EN</ipxact:name>
+            <ipxact:bitOffset>0</ipxact:bitOffset>
+            <ipxact:resets>
+              <ipxact:reset>
+                <ipxact:value>1'h1</ipxact:value>
+                <ipxact:mask>1'h1</ipxact:mask>
+              </ipxact:reset>
+            </ipxact:resets>
+            <ipxact:bitWidth>1</ipxact:bitWidth>
+          </ipxact:field>
+        </ipxact:register>
+      </ipxact:addressBlock>
+    </ipxact:memoryMap>
+  </ipxact:memoryMaps>
+</ipxact:component>
+'''
+
+def _write(directory, file_name, *components):
+    path = os.path.join(directory, file_name)
+    with open(path, 'w') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        for name, register in components:
+            f.write(COMPONENT.format(name=name, register=register))
+    return path
+
+def _convert(*args):
+    import xml_to_sqlite
+    xml_to_sqlite.main(list(args))
+
+def _dump(db_path):
+    """Return every table's rows, leaving out the run-dependent metadata.created."""
+    conn = sqlite3.connect(db_path)
+    try:
+        tables = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name")]
+        dump = {}
+        for table in tables:
+            columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})") if row[1] != 'created']
+            rows = conn.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY id")
+            dump[table] = [dict(zip(columns, row)) for row in rows]
+        return dump
+    finally:
+        conn.close()
 
 def test_help():
-    result = subprocess.run([sys.executable, '../../py/xml_to_sqlite.py', '--help'], capture_output=True, text=True)
-    assert result.returncode == 0
-    assert 'usage' in result.stdout.lower() or 'usage' in result.stderr.lower()
+    import xml_to_sqlite
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            xml_to_sqlite.main(['--help'])
+            code = 0
+        except SystemExit as e:
+            code = e.code
+    assert code == 0
+    assert 'usage' in output.getvalue().lower()
+
+def test_parallel_matches_serial():
+    with tempfile.TemporaryDirectory() as tmp:
+        # blk_a is repeated with other content: the second copy is rejected
+        # by the serial run and skipped when the shards are merged
+        files = [
+            _write(tmp, 'a.xml', ('blk_a', 'R0')),
+            EXAMPLE,
+            _write(tmp, 'dup.xml', ('blk_a', 'R1')),
+            _write(tmp, 'b.xml', ('blk_b', 'R0')),
+        ]
+        file_list = os.path.join(tmp, 'files.txt')
+        with open(file_list, 'w') as f:
+            f.write('\n'.join(files) + '\n')
+
+        serial_db = os.path.join(tmp, 'serial.db')
+        parallel_db = os.path.join(tmp, 'parallel.db')
+        _convert('-f', file_list, '-o', serial_db)
+        _convert('-f', file_list, '-o', parallel_db, '-j', '2')
+
+        serial = _dump(serial_db)
+        assert [row['name'] for row in serial['metadata']] == ['blk_a', 'register_example', 'blk_b']
+        assert _dump(parallel_db) == serial
+
+def test_multiple_top_level_components():
+    with tempfile.TemporaryDirectory() as tmp:
+        xml_file = _write(tmp, 'multi.xml', ('blk_a', 'R0'), ('blk_b', 'R1'))
+        db_path = os.path.join(tmp, 'multi.db')
+        _convert(xml_file, '-o', db_path)
+
+        dump = _dump(db_path)
+        assert [row['name'] for row in dump['metadata']] == ['blk_a', 'blk_b']
+        assert [row['name'] for row in dump['registers']] == ['R0', 'R1']
+
+def test_register_reset_from_field():
+    with tempfile.TemporaryDirectory() as tmp:
+        xml_file = os.path.join(tmp, 'field_reset.xml')
+        with open(xml_file, 'w') as f:
+            f.write(IPXACT_FIELD_RESET)
+        db_path = os.path.join(tmp, 'field_reset.db')
+        _convert(xml_file, '-o', db_path)
+
+        dump = _dump(db_path)
+        assert [(row['name'], row['resetValue'], row['resetMask']) for row in dump['registers']] == \
+            [('CTRL', "1'h1", "1'h1")]
+        assert [(row['name'], row['resetValue']) for row in dump['fields']] == [('EN', "1'h1")]
 
 if __name__ == '__main__':
+    import conftest  # puts utils/py on sys.path
     test_help()
-    print('xml_to_sqlite.py help test passed.')
\ No newline at end of file
+    test_parallel_matches_serial()
+    test_multiple_top_level_components()
+    test_register_reset_from_field()
+    print('xml_to_sqlite.py tests passed.')